@@ -1,14 +1,20 @@
-import { json } from '@sveltejs/kit';
 import { GOOGLE_MAPS_API_KEY } from '$env/static/private';
 import type { RequestHandler } from './$types';
 
-export const GET: RequestHandler = async () => {
-	// Only return whether API key is configured, not the key itself
-	const isConfigured = !!(GOOGLE_MAPS_API_KEY && GOOGLE_MAPS_API_KEY !== 'your_google_maps_api_key_here');
+// Only return whether API key is configured, not the key itself
+const isConfigured = !!(GOOGLE_MAPS_API_KEY && GOOGLE_MAPS_API_KEY !== 'your_google_maps_api_key_here');
+
+// The key is static, so serialize the payload once rather than per request.
+// Don't hard-fail in dev; expose flag and only include apiKey when configured
+const CONFIG_BODY = JSON.stringify({
+	configured: isConfigured,
+	apiKey: isConfigured ? GOOGLE_MAPS_API_KEY : undefined
+});
 
-	// Don't hard-fail in dev; expose flag and only include apiKey when configured
-	return json({
-		configured: isConfigured,
-		apiKey: isConfigured ? GOOGLE_MAPS_API_KEY : undefined
+export const GET: RequestHandler = async () => {
+	return new Response(CONFIG_BODY, {
+		headers: {
+			'Content-Type': 'application/json'
+		}
 	});
 };
\ No newline at end of file
@@ -1,43 +1,7 @@
 import { json } from '@sveltejs/kit';
 import { GOOGLE_MAPS_API_KEY } from '$env/static/private';
 import type { RequestHandler } from './$types';
-
-// Places API (New) field mask - only valid fields
-const FIELD_MASK = [
-	'places.id',
-	'places.displayName',
-	'places.formattedAddress',
-	'places.internationalPhoneNumber',
-	'places.websiteUri',
-	'places.rating',
-	'places.userRatingCount',
-	'places.primaryType',
-	'places.types',
-	'places.businessStatus',
-	'places.location'
-].join(',');
-
-function transformPlaceData(place: any) {
-	return {
-		id: place.id,
-		displayName: place.displayName?.text || '',
-		formattedAddress: place.formattedAddress || '',
-		internationalPhoneNumber: place.internationalPhoneNumber,
-		nationalPhoneNumber: null, // Not available in Places API (New)
-		websiteUri: place.websiteUri,
-		rating: place.rating,
-		userRatingCount: place.userRatingCount,
-		primaryType: place.primaryType,
-		primaryTypeDisplayName: place.primaryType, // Use primaryType as display name
-		types: place.types,
-		businessStatus: place.businessStatus,
-		editorialSummary: null, // Not available in Places API (New)
-		location: {
-			latitude: place.location?.latitude || 0,
-			longitude: place.location?.longitude || 0
-		}
-	};
-}
+import { FIELD_MASK, transformPlaceData } from '$lib/server/places';
 
 export const POST: RequestHandler = async ({ request }) => {
 	try {
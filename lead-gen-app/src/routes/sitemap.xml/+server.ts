@@ -1,17 +1,21 @@
-export async function GET() {
-	const sitemap = `<?xml version="1.0" encoding="UTF-8"?>
+// Built once per server instance instead of on every request
+const LAST_MODIFIED = new Date().toISOString().split('T')[0];
+
+const SITEMAP = `<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
 	<url>
 		<loc>https://yourdomain.com</loc>
-		<lastmod>${new Date().toISOString().split('T')[0]}</lastmod>
+		<lastmod>${LAST_MODIFIED}</lastmod>
 		<changefreq>weekly</changefreq>
 		<priority>1.0</priority>
 	</url>
 </urlset>`;
 
-	return new Response(sitemap, {
+export async function GET() {
+	return new Response(SITEMAP, {
 		headers: {
-			'Content-Type': 'application/xml'
+			'Content-Type': 'application/xml',
+			'Cache-Control': 'public, max-age=3600'
 		}
 	});
 }
\ No newline at end of file